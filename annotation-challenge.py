@@ -1,104 +1,162 @@
 import re
+import sys
+import functools
+from concurrent.futures import ThreadPoolExecutor
 import requests
+from requests.adapters import HTTPAdapter
+import numpy as np
 import pandas as pd
+from io import BytesIO, StringIO
 from html.parser import HTMLParser
 from urllib.parse import urlparse, parse_qs
 
+_NON_DIGIT_RE = re.compile(r'\D')
+_HAS_DIGIT = re.compile(r'\d').search
+_TEXT_HEADER_RE = re.compile(r'^.*x-coordinate.*character.*y-coordinate.*$',
+                             re.IGNORECASE | re.MULTILINE)
+_COORD_LINE_RE = re.compile(r'^[^\n]*?(\d+)[^\S\n]+(\S)[^\n\d]*(\d+)', re.MULTILINE)
+_DOC_ID_PATTERNS = (
+    re.compile(r'/document/d/([a-zA-Z0-9-_]+)'),
+    re.compile(r'/document/u/\d+/d/([a-zA-Z0-9-_]+)'),
+    re.compile(r'/spreadsheets/d/([a-zA-Z0-9-_]+)'),
+    re.compile(r'/spreadsheets/u/\d+/d/([a-zA-Z0-9-_]+)'),
+)
+_MANUAL_PATTERNS = (
+    re.compile(r'.*?(\d+).*?(\d+).*?[=:].*?(\S)'),  # Patterns like "x=1, y=2: *"
+    re.compile(r'\((\d+),\s*(\d+)\)\s*[=:]?\s*(\S)'),  # Patterns like "(1, 2) = *"
+    re.compile(r'(\d+)[,\s]+(\S)[,\s]+(\d+)'),  # Patterns like "1, *, 2"
+)
+# Shared HTTP session so every export request reuses the same keep-alive connection
+_SESSION = requests.Session()
+_SESSION.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=4))
+
 class TableParser(HTMLParser):
     """
-    Custom HTML parser to extract table data from Google Docs HTML export
+    Custom HTML parser to extract table data from Google Docs HTML export.
+    Only used when neither lxml nor html5lib is installed.
     """
     def __init__(self):
         super().__init__()
         self.tables = []
         self.current_table = []
         self.current_row = []
-        self.current_cell = ""
+        self.current_cell_parts = []
         self.in_table = False
         self.in_row = False
         self.in_cell = False
         
+        # Dispatch tables built once so each tag is a single dict lookup
+        self._start = {
+            'table': self._start_table,
+            'tr': self._start_row,
+            'td': self._start_cell,
+            'th': self._start_cell,
+        }
+        self._end = {
+            'table': self._end_table,
+            'tr': self._end_row,
+            'td': self._end_cell,
+            'th': self._end_cell,
+        }
+        
     def handle_starttag(self, tag, attrs):
-        if tag == 'table':
-            self.in_table = True
-            self.current_table = []
-        elif tag == 'tr' and self.in_table:
+        handler = self._start.get(tag)
+        if handler:
+            handler()
+            
+    def handle_endtag(self, tag):
+        handler = self._end.get(tag)
+        if handler:
+            handler()
+            
+    def handle_data(self, data):
+        if self.in_cell:
+            self.current_cell_parts.append(data)
+    
+    def _start_table(self):
+        self.in_table = True
+        self.current_table = []
+    
+    def _start_row(self):
+        if self.in_table:
             self.in_row = True
             self.current_row = []
-        elif (tag == 'td' or tag == 'th') and self.in_row:
+    
+    def _start_cell(self):
+        if self.in_row:
             self.in_cell = True
-            self.current_cell = ""
-            
-    def handle_endtag(self, tag):
-        if tag == 'table':
-            self.tables.append(self.current_table)
-            self.in_table = False
-        elif tag == 'tr' and self.in_table:
+            self.current_cell_parts = []
+    
+    def _end_table(self):
+        self.tables.append(self.current_table)
+        self.in_table = False
+    
+    def _end_row(self):
+        if self.in_table:
             self.current_table.append(self.current_row)
             self.in_row = False
-        elif (tag == 'td' or tag == 'th') and self.in_row:
-            self.current_row.append(self.current_cell.strip())
+    
+    def _end_cell(self):
+        if self.in_row:
+            self.current_row.append(''.join(self.current_cell_parts).strip())
             self.in_cell = False
-            
-    def handle_data(self, data):
-        if self.in_cell:
-            self.current_cell += data
+
+def _parse_coords(values):
+    """
+    Convert coordinate strings to an int32 array. Stray non-digit characters
+    are stripped; values with no digits at all become -1.
+    """
+    return np.fromiter(
+        (int(v) if v.isdecimal() else int(_NON_DIGIT_RE.sub('', v) or -1) for v in values),
+        dtype=np.int32,
+        count=len(values),
+    )
+
 
 def print_unicode_grid_from_gdoc(url):
     """
     Retrieves data from a Google Doc table and prints a grid of Unicode characters.
     
     Args:
-        url (str): URL of the Google Doc containing a table with columns:
+        url (str): URL of the Google Doc (or Google Sheet) containing a table with columns:
                   'x-coordinate', 'Character', and 'y-coordinate'
     """
     try:
         # Extract document ID from URL
         doc_id = extract_doc_id(url)
         
-        # Try multiple formats to extract data
-        coordinates = []
-        
-        # Try HTML format first (more structured)
-        coordinates = try_html_format(doc_id)
-        
-        # If HTML didn't work, try plain text
-        if not coordinates:
-            coordinates = try_text_format(doc_id)
-            
-        # If still no coordinates, try downloading the document as DOCX
-        if not coordinates:
-            coordinates = try_docx_format(doc_id)
+        if '/spreadsheets/' in urlparse(url).path:
+            # Google Sheets only have the CSV export, so skip the document formats entirely
+            coordinates = try_direct_csv_export(doc_id)
+        else:
+            coordinates = extract_document_coordinates(doc_id)
         
         if not coordinates:
             print("No valid coordinate data found in the document.")
             return
         
-        # Convert to DataFrame for easier processing
-        df = pd.DataFrame(coordinates, columns=['x-coordinate', 'Character', 'y-coordinate'])
-        
-        # Ensure coordinate columns are numeric and strip any non-numeric characters
-        df['x-coordinate'] = pd.to_numeric(df['x-coordinate'].str.replace(r'[^\d]', '', regex=True))
-        df['y-coordinate'] = pd.to_numeric(df['y-coordinate'].str.replace(r'[^\d]', '', regex=True))
-        
-        # Calculate grid dimensions
-        max_x = int(df['x-coordinate'].max())
-        max_y = int(df['y-coordinate'].max())
+        # Split into flat NumPy arrays; a DataFrame is overkill for three small columns
+        xs, chars, ys = zip(*coordinates)
+        xs = _parse_coords(xs)
+        ys = _parse_coords(ys)
+        # Take first character if multiple
+        chars = np.asarray([char[:1] or ' ' for char in chars], dtype='U1')
         
-        # Create an empty grid filled with spaces
-        grid = [[' ' for _ in range(max_x + 1)] for _ in range(max_y + 1)]
+        # Drop entries whose coordinates couldn't be parsed
+        valid = (xs >= 0) & (ys >= 0)
+        if not valid.any():
+            print("No valid coordinate data found in the document.")
+            return
+        xs, ys, chars = xs[valid], ys[valid], chars[valid]
         
-        # Place characters in the grid
-        for _, row in df.iterrows():
-            x = int(row['x-coordinate'])
-            y = int(row['y-coordinate'])
-            char = row['Character']
-            if len(char) > 0:  # Ensure we have a character
-                grid[y][x] = char[0]  # Take first character if multiple
+        # Create an empty grid filled with spaces and place all characters in one shot
+        grid = np.full((ys.max() + 1, xs.max() + 1), ' ', dtype='U1')
+        grid[ys, xs] = chars
         
-        # Print the grid
-        for row in grid:
-            print(''.join(row))
+        # Print the grid with a single write; viewing each row of U1 cells as one
+        # U{width} string lets NumPy build the row strings without a Python join per row
+        rows = grid.view(f'U{grid.shape[1]}').ravel()
+        sys.stdout.write('\n'.join(rows) + '\n')
             
     except Exception as e:
         print(f"Error: {e}")
@@ -106,16 +164,36 @@ def print_unicode_grid_from_gdoc(url):
         traceback.print_exc()
 
 
-def extract_doc_id(url):
-    """Extract the document ID from a Google Docs URL."""
-    # Parse URL patterns like /document/d/{doc_id}/edit or /document/u/0/d/{doc_id}/edit
-    patterns = [
-        r'/document/d/([a-zA-Z0-9-_]+)',
-        r'/document/u/\d+/d/([a-zA-Z0-9-_]+)'
-    ]
+def extract_document_coordinates(doc_id):
+    """
+    Try multiple formats to extract data from a Google Doc. The HTML and
+    plain text exports are fetched concurrently, but HTML (more structured)
+    is always preferred; plain text is used only if HTML yields nothing,
+    and the DOCX export only if both come up empty.
+    """
+    executor = ThreadPoolExecutor(max_workers=2)
+    try:
+        html_future = executor.submit(try_html_format, doc_id)
+        text_future = executor.submit(try_text_format, doc_id)
+        
+        coordinates = html_future.result()
+        if coordinates:
+            # Don't wait on the text export when HTML already has the data
+            return coordinates
+        
+        coordinates = text_future.result()
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
     
-    for pattern in patterns:
-        match = re.search(pattern, url)
+    return coordinates or try_docx_format(doc_id)
+
+
+def extract_doc_id(url):
+    """Extract the document ID from a Google Docs or Google Sheets URL."""
+    # Parse URL patterns like /document/d/{doc_id}/edit, /document/u/0/d/{doc_id}/edit
+    # and their /spreadsheets/ equivalents
+    for pattern in _DOC_ID_PATTERNS:
+        match = pattern.search(url)
         if match:
             return match.group(1)
     
@@ -128,59 +206,155 @@ def extract_doc_id(url):
     raise ValueError("Could not extract document ID from URL")
 
 
+def _download_export(doc_id, fmt):
+    """Download a Google Docs export, raising on a non-200 response."""
+    export_url = f"https://docs.google.com/document/d/{doc_id}/export?format={fmt}"
+    response = _SESSION.get(export_url, timeout=10)
+    response.raise_for_status()
+    return response
+
+
+@functools.lru_cache(maxsize=8)
+def _fetch_export(doc_id, fmt):
+    """
+    Download a Google Docs export as text. Results are cached per
+    (doc_id, fmt) so repeated extraction attempts don't refetch the document.
+    """
+    return _download_export(doc_id, fmt).text
+
+
+def _frame_rows(df):
+    """Iterate a DataFrame as rows of cells, header row first."""
+    yield list(df.columns)
+    yield from df.itertuples(index=False, name=None)
+
+
+def read_html_tables(html_bytes):
+    """
+    Yield every table in a raw HTML document as an iterable of cell rows,
+    header row first.
+    Streams tables one at a time with lxml's iterparse when lxml is installed;
+    if lxml is missing or fails to parse, tries pd.read_html with html5lib,
+    and only falls back to the pure-Python TableParser when neither is usable.
+    """
+    try:
+        from lxml import etree
+    except ImportError:
+        etree = None
+    
+    if etree is not None:
+        try:
+            for _, table in etree.iterparse(BytesIO(html_bytes), html=True, tag='table',
+                                            encoding='utf-8'):
+                rows = [[''.join(cell.itertext()).strip() for cell in tr.iter('td', 'th')]
+                        for tr in table.iter('tr')]
+                # Drop the parsed table and everything before it so memory stays
+                # bounded by the largest table rather than the whole document.
+                # A nested table is left alone: its siblings are still part of
+                # the enclosing table, which hasn't been read yet.
+                if next(table.iterancestors('table'), None) is None:
+                    table.clear()
+                    while table.getprevious() is not None:
+                        del table.getparent()[0]
+                if rows:
+                    yield rows
+            return
+        except etree.LxmlError:
+            pass
+    
+    try:
+        tables = pd.read_html(BytesIO(html_bytes), flavor='html5lib', header=0,
+                              keep_default_na=False)
+    except ValueError:
+        # pandas raises ValueError when the document has no tables
+        return
+    except ImportError:
+        tables = None
+    
+    if tables is not None:
+        for df in tables:
+            yield _frame_rows(df)
+        return
+    
+    parser = TableParser()
+    parser.feed(html_bytes.decode('utf-8', errors='replace'))
+    for table in parser.tables:
+        if table:
+            yield table
+
+
+def _first(mask):
+    """Return the index of the first True entry in a boolean mask, or -1 if there is none."""
+    return int(np.argmax(mask)) if mask.any() else -1
+
+
+def _locate_cols(header):
+    """
+    Find the (x, char, y) column indices in a table header, allowing for
+    variations in naming. Missing columns are reported as -1.
+    """
+    h = np.char.lower(np.asarray([str(cell).strip() for cell in header], dtype=str))
+    if h.size == 0:
+        return -1, -1, -1
+    
+    is_coord = (np.char.find(h, 'coord') >= 0) | (np.char.find(h, 'position') >= 0)
+    x_mask = (np.char.find(h, 'x') >= 0) & is_coord
+    char_mask = (np.char.find(h, 'char') >= 0) & ~x_mask
+    y_mask = (np.char.find(h, 'y') >= 0) & is_coord & ~x_mask & ~char_mask
+    return _first(x_mask), _first(char_mask), _first(y_mask)
+
+
+def _extract_from_rows(rows, cols=None):
+    """
+    Collect [x, char, y] entries from an iterable of table rows whose first
+    row is the header. If the (x, char, y) column indices are already known,
+    pass them as cols and leave the header out. Returns an empty list if the
+    columns can't be found.
+    """
+    coordinates = []
+    rows = iter(rows)
+    
+    if cols is None:
+        header = next(rows, None)
+        if header is None:
+            return coordinates
+        
+        # Find our columns (allowing for variations in naming)
+        cols = _locate_cols(header)
+    
+    x_idx, char_idx, y_idx = cols
+    if x_idx < 0 or char_idx < 0 or y_idx < 0:
+        return coordinates
+    
+    # Process data rows
+    min_len = max(x_idx, char_idx, y_idx) + 1
+    for row in rows:
+        if len(row) >= min_len:
+            x = str(row[x_idx]).strip()
+            char = str(row[char_idx]).strip()
+            y = str(row[y_idx]).strip()
+            
+            # Check if values look valid; plain digit strings skip the regex engine
+            if char and (x.isdecimal() or _HAS_DIGIT(x)) and (y.isdecimal() or _HAS_DIGIT(y)):
+                coordinates.append([x, char, y])
+    
+    return coordinates
+
+
 def try_html_format(doc_id):
     """Try to extract coordinates from HTML export."""
     coordinates = []
     
     try:
-        # Use HTML export
-        export_url = f"https://docs.google.com/document/d/{doc_id}/export?format=html"
-        response = requests.get(export_url)
+        # Use HTML export; the raw bytes go straight to the parser without
+        # being decoded or cached, so only one copy of the document is held
+        html_bytes = _download_export(doc_id, 'html').content
         
-        if response.status_code == 200:
-            html_content = response.text
-            
-            # Parse HTML to find tables
-            parser = TableParser()
-            parser.feed(html_content)
-            
-            # Process each table found
-            for table in parser.tables:
-                if len(table) < 2:  # Need at least header + one data row
-                    continue
-                
-                # Check if header row contains our expected columns
-                header = [cell.lower() for cell in table[0]]
-                
-                # Find indices for our columns (allowing for variations in naming)
-                x_idx = -1
-                char_idx = -1
-                y_idx = -1
-                
-                for i, cell in enumerate(header):
-                    if 'x' in cell and ('coord' in cell or 'position' in cell):
-                        x_idx = i
-                    elif 'char' in cell:
-                        char_idx = i
-                    elif 'y' in cell and ('coord' in cell or 'position' in cell):
-                        y_idx = i
-                
-                # If we found all three columns
-                if x_idx >= 0 and char_idx >= 0 and y_idx >= 0:
-                    # Process data rows
-                    for row in table[1:]:
-                        if len(row) > max(x_idx, char_idx, y_idx):
-                            x = row[x_idx].strip()
-                            char = row[char_idx].strip()
-                            y = row[y_idx].strip()
-                            
-                            # Check if values look valid
-                            if re.search(r'\d+', x) and re.search(r'\d+', y) and char:
-                                coordinates.append([x, char, y])
-                    
-                    # If we found valid data, return it
-                    if coordinates:
-                        return coordinates
+        # Process each table found; the first one with valid data wins
+        for rows in read_html_tables(html_bytes):
+            coordinates = _extract_from_rows(rows)
+            if coordinates:
+                return coordinates
     
     except Exception as e:
         print(f"HTML extraction error: {e}")
@@ -194,41 +368,17 @@ def try_text_format(doc_id):
     
     try:
         # Use plain text export
-        export_url = f"https://docs.google.com/document/d/{doc_id}/export?format=txt"
-        response = requests.get(export_url)
+        text_content = _fetch_export(doc_id, 'txt')
         
-        if response.status_code == 200:
-            text_content = response.text
-            
-            # Try to identify table structure
-            lines = text_content.split('\n')
-            
-            # Look for lines with "x-coordinate" and "y-coordinate"
-            table_start = -1
-            for i, line in enumerate(lines):
-                if ('x-coordinate' in line.lower() and 
-                    'character' in line.lower() and 
-                    'y-coordinate' in line.lower()):
-                    table_start = i
-                    break
-            
-            if table_start >= 0:
-                # Extract data using pattern matching
-                for i in range(table_start + 1, len(lines)):
-                    line = lines[i].strip()
-                    if not line:
-                        continue
-                    
-                    # Try to extract three columns of data
-                    # Pattern: numbers followed by character followed by numbers
-                    # More flexible version: Look for numbers and single character
-                    match = re.search(r'(\d+)\s+(\S)[\s\D]*(\d+)', line)
-                    if match:
-                        x = match.group(1)
-                        char = match.group(2)
-                        y = match.group(3)
-                        coordinates.append([x, char, y])
-    
+        # Look for the header line with "x-coordinate" and "y-coordinate"
+        header = _TEXT_HEADER_RE.search(text_content)
+        
+        if header:
+            # Extract data using pattern matching in a single pass over the rest of the text
+            # Pattern: numbers followed by character followed by numbers, one match per line
+            coordinates = [list(match.groups())
+                           for match in _COORD_LINE_RE.finditer(text_content, header.end())]
+
     except Exception as e:
         print(f"Text extraction error: {e}")
     
@@ -246,57 +396,13 @@ def try_docx_format(doc_id):
         # Try to import docx library
         import docx
         
-        # Download the document as DOCX
-        export_url = f"https://docs.google.com/document/d/{doc_id}/export?format=docx"
-        response = requests.get(export_url)
+        # Download the document as DOCX and open it straight from memory
+        doc = docx.Document(BytesIO(_download_export(doc_id, 'docx').content))
         
-        if response.status_code == 200:
-            # Save to temporary file
-            with open('temp_doc.docx', 'wb') as f:
-                f.write(response.content)
-            
-            # Open the document
-            doc = docx.Document('temp_doc.docx')
-            
-            # Extract tables
-            for table in doc.tables:
-                if len(table.rows) < 2:  # Need at least header + one data row
-                    continue
-                
-                # Get header row
-                header = [cell.text.lower().strip() for cell in table.rows[0].cells]
-                
-                # Find our columns
-                x_idx = -1
-                char_idx = -1
-                y_idx = -1
-                
-                for i, cell in enumerate(header):
-                    if 'x' in cell and ('coord' in cell or 'position' in cell):
-                        x_idx = i
-                    elif 'char' in cell:
-                        char_idx = i
-                    elif 'y' in cell and ('coord' in cell or 'position' in cell):
-                        y_idx = i
-                
-                # If we found all three columns
-                if x_idx >= 0 and char_idx >= 0 and y_idx >= 0:
-                    # Process data rows
-                    for row in table.rows[1:]:
-                        cells = row.cells
-                        if len(cells) > max(x_idx, char_idx, y_idx):
-                            x = cells[x_idx].text.strip()
-                            char = cells[char_idx].text.strip()
-                            y = cells[y_idx].text.strip()
-                            
-                            # Check if values look valid
-                            if re.search(r'\d+', x) and re.search(r'\d+', y) and char:
-                                coordinates.append([x, char, y])
-            
-            # Clean up
-            import os
-            if os.path.exists('temp_doc.docx'):
-                os.remove('temp_doc.docx')
+        # Extract tables
+        for table in doc.tables:
+            rows = ([cell.text for cell in row.cells] for row in table.rows)
+            coordinates.extend(_extract_from_rows(rows))
     
     except ImportError:
         print("python-docx library not available, skipping DOCX extraction")
@@ -316,45 +422,26 @@ def try_direct_csv_export(doc_id):
     try:
         # Try to export as CSV (for Google Sheets)
         export_url = f"https://docs.google.com/spreadsheets/d/{doc_id}/export?format=csv"
-        response = requests.get(export_url)
+        response = _SESSION.get(export_url, timeout=10)
         
         if response.status_code == 200:
-            # Parse CSV data
-            import csv
-            from io import StringIO
-            
             csv_data = response.text
-            csv_reader = csv.reader(StringIO(csv_data))
+            if not csv_data.strip():
+                return coordinates
             
-            # Get header row
-            header = next(csv_reader, [])
-            header = [col.lower().strip() for col in header]
-            
-            # Find our columns
-            x_idx = -1
-            char_idx = -1
-            y_idx = -1
-            
-            for i, col in enumerate(header):
-                if 'x' in col and ('coord' in col or 'position' in col):
-                    x_idx = i
-                elif 'char' in col:
-                    char_idx = i
-                elif 'y' in col and ('coord' in col or 'position' in col):
-                    y_idx = i
+            # Read just the header row to find our columns
+            header = pd.read_csv(StringIO(csv_data), nrows=0).columns
+            x_idx, char_idx, y_idx = _locate_cols(header)
             
             # If we found all three columns
             if x_idx >= 0 and char_idx >= 0 and y_idx >= 0:
-                # Process data rows
-                for row in csv_reader:
-                    if len(row) > max(x_idx, char_idx, y_idx):
-                        x = row[x_idx].strip()
-                        char = row[char_idx].strip()
-                        y = row[y_idx].strip()
-                        
-                        # Check if values look valid
-                        if re.search(r'\d+', x) and re.search(r'\d+', y) and char:
-                            coordinates.append([x, char, y])
+                # Let the C tokenizer parse only the three columns we need;
+                # usecols keeps file order, so reorder to (x, char, y) afterwards
+                wanted = [header[x_idx], header[char_idx], header[y_idx]]
+                df = pd.read_csv(StringIO(csv_data), usecols=[x_idx, char_idx, y_idx],
+                                 dtype=str, keep_default_na=False)
+                coordinates = _extract_from_rows(df[wanted].itertuples(index=False, name=None),
+                                                 cols=(0, 1, 2))
     
     except Exception as e:
         print(f"CSV extraction error: {e}")
@@ -362,6 +449,18 @@ def try_direct_csv_export(doc_id):
     return coordinates
 
 
+def _interpret_manual_match(groups):
+    """Order the three captured values of a manual-extraction match as [x, char, y]."""
+    # Determine which values are x, y, and char
+    if len(groups[1]) == 1 and not groups[1].isdigit():
+        # Format is likely (x, char, y)
+        x, char, y = groups
+    else:
+        # Format is likely (x, y, char)
+        x, y, char = groups
+    return [x, char, y]
+
+
 def manual_grid_extraction(doc_id):
     """
     Last resort: Try to manually extract a grid from the document text
@@ -371,35 +470,14 @@ def manual_grid_extraction(doc_id):
     
     try:
         # Use plain text export
-        export_url = f"https://docs.google.com/document/d/{doc_id}/export?format=txt"
-        response = requests.get(export_url)
+        text_content = _fetch_export(doc_id, 'txt')
         
-        if response.status_code == 200:
-            text_content = response.text
-            
-            # Try to find all patterns that look like coordinates and characters
-            # Pattern: (x,y)=char or similar patterns
-            patterns = [
-                r'.*?(\d+).*?(\d+).*?[=:].*?(\S)',  # Patterns like "x=1, y=2: *"
-                r'\((\d+),\s*(\d+)\)\s*[=:]?\s*(\S)',  # Patterns like "(1, 2) = *"
-                r'(\d+)[,\s]+(\S)[,\s]+(\d+)',  # Patterns like "1, *, 2"
-            ]
-            
-            for pattern in patterns:
-                matches = re.findall(pattern, text_content)
-                if matches:
-                    for match in matches:
-                        if len(match) == 3:
-                            # Determine which values are x, y, and char
-                            if len(match[1]) == 1 and not match[1].isdigit():
-                                # Format is likely (x, char, y)
-                                x, char, y = match
-                            else:
-                                # Format is likely (x, y, char)
-                                x, y, char = match
-                            
-                            coordinates.append([x, char, y])
-    
+        # Try to find all patterns that look like coordinates and characters
+        # Pattern: (x,y)=char or similar patterns
+        for pattern in _MANUAL_PATTERNS:
+            coordinates.extend(_interpret_manual_match(match.groups())
+                               for match in pattern.finditer(text_content))
+
     except Exception as e:
         print(f"Manual extraction error: {e}")
         